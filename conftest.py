@@ -4,14 +4,8 @@ Pytest configuration file for pydoc-markdown-nuxt.
 This file contains shared fixtures and configuration for all tests.
 """
 
-import os
-import sys
-
 import pytest
 
-# Add src to path so we can import our module without installing it
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
 
 # Fixture for temporary test directory
 @pytest.fixture
@@ -23,7 +17,7 @@ def temp_test_dir(tmp_path):
 
 
 # Fixture for sample docstrings
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_arguments_docstring():
     """Provide a sample docstring with arguments section."""
     return """
@@ -41,7 +35,7 @@ Some return value
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comprehensive_docstring():
     """Provide a comprehensive docstring with multiple sections."""
     return """
@@ -5,22 +5,51 @@ This package provides a renderer for pydoc-markdown that generates documentation
 following the Nuxt Content and MDC (Markdown Components) structure.
 """
 
+import importlib
+import typing as t
+
 __version__ = "0.1.1"
 __author__ = "Uriel Curiel"
 __email__ = "urielcuriel@outlook.com"
 
-from .renderer import NuxtPage, NuxtRenderer
-from .utils import (
-    NuxtContentHelper,
-    create_api_overview_table,
-    create_mdc_alert,
-    create_mdc_code_group,
-    create_mdc_tabs,
-    create_navigation_entry,
-    enhance_frontmatter_for_nuxt,
-    format_python_signature_for_mdc,
-    generate_api_breadcrumbs,
-)
+if t.TYPE_CHECKING:
+    from .renderer import NuxtPage, NuxtRenderer
+    from .utils import (
+        NuxtContentHelper,
+        create_api_overview_table,
+        create_mdc_alert,
+        create_mdc_arguments,
+        create_mdc_code_group,
+        create_mdc_tabs,
+        create_mdc_variables,
+        create_navigation_entry,
+        create_variable_or_argument_component,
+        enhance_frontmatter_for_nuxt,
+        format_python_signature_for_mdc,
+        generate_api_breadcrumbs,
+    )
+
+# Public names are resolved lazily (PEP 562) so that importing a single helper
+# does not pull in pydoc-markdown and docspec through the renderer module.
+_LAZY_ATTRS = {
+    "NuxtRenderer": ".renderer",
+    "NuxtPage": ".renderer",
+    "create_mdc_alert": ".utils",
+    "create_mdc_code_group": ".utils",
+    "create_mdc_tabs": ".utils",
+    "create_mdc_variables": ".utils",
+    "create_mdc_arguments": ".utils",
+    "create_variable_or_argument_component": ".utils",
+    "create_navigation_entry": ".utils",
+    "enhance_frontmatter_for_nuxt": ".utils",
+    "generate_api_breadcrumbs": ".utils",
+    "format_python_signature_for_mdc": ".utils",
+    "create_api_overview_table": ".utils",
+    "NuxtContentHelper": ".utils",
+}
+
+#: Submodules reachable as package attributes, e.g. ``pydoc_markdown_nuxt.utils``.
+_SUBMODULES = frozenset({"renderer", "utils"})
 
 __all__ = [
     "NuxtRenderer",
@@ -28,6 +57,9 @@ __all__ = [
     "create_mdc_alert",
     "create_mdc_code_group",
     "create_mdc_tabs",
+    "create_mdc_variables",
+    "create_mdc_arguments",
+    "create_variable_or_argument_component",
     "create_navigation_entry",
     "enhance_frontmatter_for_nuxt",
     "generate_api_breadcrumbs",
@@ -35,3 +67,18 @@ __all__ = [
     "create_api_overview_table",
     "NuxtContentHelper",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -7,10 +7,13 @@ Nuxt Content and MDC (Markdown Components) syntax.
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import functools
 import logging
 import os
 import posixpath
+import re
 import typing as t
 from pathlib import Path
 
@@ -24,14 +27,93 @@ from pydoc_markdown.util.pages import GenericPage, Pages
 
 from .utils import (
     _convert_to_kebab_case,
+    _create_mdc_code_group,
     create_mdc_alert,
     create_mdc_arguments,
-    create_mdc_code_group,
     create_mdc_variables,
 )
 
 logger = logging.getLogger(__name__)
 
+#: Characters that ``html.escape()`` rewrites; docstrings without any of them need no escaping.
+_HTML_SPECIAL_RE = re.compile(r"[&<>\"']")
+
+# Patterns used by the MDC docstring converters, compiled once at import time. Every
+# section is described once below; the standalone per-section patterns and the fused
+# #_SECTIONS_RE are both assembled from these fragments.
+
+#: Lookahead that ends a section body: the next ``**Header**`` or the end of the docstring.
+_SECTION_END = r"(?=\n\n\*\*|\Z)"
+
+#: One or more ``- `name` - description`` items of a list section.
+_LIST_ITEMS = r"(?:\s*- `[^`]+` - [^\n]+\n?)+"
+
+#: Header and body patterns of the sections whose body runs until #_SECTION_END.
+_BLOCK_SECTIONS: t.Dict[str, t.Tuple[str, str]] = {
+    "returns": (r"\*\*Returns\*\*:", r"[^*]+"),
+    "examples": (r"\*\*Examples\*\*:", r".*?"),
+    "notes": (r"\*\*Notes?\*\*:", r".*?"),
+    "warnings": (r"\*\*Warnings?\*\*:", r".*?"),
+    "raises": (r"\*\*Raises\*\*:", r".*?"),
+}
+
+
+def _blank_lines(group_name: str) -> str:
+    """Return the pattern for the whitespace between a list section header and its first item.
+
+    This is at least two line breaks. The lookahead plus backreference makes the run atomic,
+    so a header followed by a long blank stretch but no items fails in linear time instead of
+    backtracking through every way of splitting the whitespace. The run is captured in
+    *group_name*, which must be unique within the final pattern.
+    """
+    return rf"(?=(?P<{group_name}>(?:[^\S\n]*\n){{2,}}))(?P={group_name})"
+
+
+def _list_section(section_name: str, name: str) -> str:
+    """Return the pattern for a ``**Section**:`` list section, capturing its items in ``<name>_body``."""
+    blank_lines = _blank_lines(f"{name}_blank")
+    return rf"\*\*{re.escape(section_name)}\*\*:{blank_lines}(?P<{name}_body>{_LIST_ITEMS})"
+
+
+def _block_section(name: str) -> str:
+    """Return the pattern for the #_BLOCK_SECTIONS entry *name*, capturing its body in ``<name>_body``."""
+    header, body = _BLOCK_SECTIONS[name]
+    return rf"{header}\s*\n\n(?P<{name}_body>{body}){_SECTION_END}"
+
+
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+_ITEM_RE = re.compile(r"\s*- `([^`]+)` - (.+)")
+_RAISES_ITEM_RE = re.compile(r"- `([^`]+)`: (.+)")
+_RETURNS_RE = re.compile(_block_section("returns"), re.DOTALL)
+_EXAMPLES_RE = re.compile(_block_section("examples"), re.DOTALL)
+_NOTES_RE = re.compile(_block_section("notes"), re.DOTALL)
+_WARNINGS_RE = re.compile(_block_section("warnings"), re.DOTALL)
+_RAISES_RE = re.compile(_block_section("raises"), re.DOTALL)
+
+#: All sections handled by the MDC pipeline fused into one alternation. Each alternative
+#: is named after its section and captures the section body in ``<name>_body``.
+_SECTIONS_RE = re.compile(
+    "|".join(
+        [
+            f"(?P<arguments>{_list_section('Arguments', 'arguments')})",
+            *(f"(?P<{name}>{_block_section(name)})" for name in _BLOCK_SECTIONS),
+        ]
+    ),
+    re.DOTALL,
+)
+
+
+def _code_block_from_match(match: t.Match[str]) -> t.Tuple[str, str, str]:
+    """Return the ``(language, filename, code)`` tuple for a #_CODE_BLOCK_RE match."""
+    language = match.group(1) or "text"
+    return language, language, match.group(2).strip()
+
+
+@functools.lru_cache(maxsize=32)
+def _section_pattern(section_name: str) -> t.Pattern[str]:
+    """Return the compiled pattern for a ``**Section**:`` header followed by list items."""
+    return re.compile(_list_section(section_name, "items"), re.DOTALL)
+
 
 @dataclasses.dataclass
 class NuxtPage(GenericPage["NuxtPage"]):
@@ -84,6 +166,15 @@ class MDCMarkdownRenderer(MarkdownRenderer):
 
     def __post_init__(self) -> None:
         self._resolver = t.cast(MarkdownReferenceResolver, NuxtContentResolver(self.content_directory))
+        # Converted docstrings keyed by their source text. Inherited and re-exported members
+        # repeat docstrings verbatim, and the conversion only depends on the text and on
+        # ``mdc_components``, which is snapshotted so that changing it drops the cache.
+        self._mdc_docstrings: t.Dict[str, str] = {}
+        self._mdc_docstrings_components: t.Dict[str, str] = {}
+
+    def _component_name(self, component_key: str, default: str) -> str:
+        """Return the kebab-case name of the component configured for ``component_key``."""
+        return _convert_to_kebab_case(self.mdc_components.get(component_key, default))
 
     def _render_object(self, fp: t.TextIO, level: int, obj: docspec.ApiObject):
         """Override to process docstrings and convert Arguments sections to MDC components."""
@@ -127,12 +218,11 @@ class MDCMarkdownRenderer(MarkdownRenderer):
         docstring_content = obj.docstring.content
         if self.use_mdc:
             docstring_content = self._process_docstring_for_mdc(docstring_content)
-        if self.escape_html_in_docstring:
+        if self.escape_html_in_docstring and _HTML_SPECIAL_RE.search(docstring_content):
             docstring_content = escape_except_blockquotes(docstring_content)
-        lines = docstring_content.split("\n")
         if self.docstrings_as_blockquote:
-            lines = ["> " + x for x in lines]
-        fp.write("\n".join(lines))
+            docstring_content = "> " + docstring_content.replace("\n", "\n> ")
+        fp.write(docstring_content)
         fp.write("\n\n")
 
     def _process_docstring_for_mdc(self, docstring: str) -> str:
@@ -146,29 +236,29 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             replaced with MDC components.
         """
 
-        # Process in order of specificity
-        processed = docstring
-
-        # 1. Convert Arguments sections
-        processed = self._convert_section_to_mdc(processed, "Arguments", "arguments")
-
-        # 2. Convert Returns sections
-        processed = self._convert_returns_to_mdc(processed)
-
-        # 3. Convert Examples sections
-        processed = self._convert_examples_to_mdc(processed)
+        if self._mdc_docstrings_components != self.mdc_components:
+            self._mdc_docstrings.clear()
+            self._mdc_docstrings_components = dict(self.mdc_components)
+        processed = self._mdc_docstrings.get(docstring)
+        if processed is None:
+            processed = self._mdc_docstrings[docstring] = self._convert_docstring_to_mdc(docstring)
+        return processed
 
-        # 4. Convert Notes sections to alerts
-        processed = self._convert_notes_to_mdc(processed)
+    def _convert_docstring_to_mdc(self, docstring: str) -> str:
+        """Uncached implementation of #_process_docstring_for_mdc()."""
 
-        # 5. Convert Warnings sections to alerts
-        processed = self._convert_warnings_to_mdc(processed)
+        processed = docstring
 
-        # 6. Convert Raises sections
-        processed = self._convert_raises_to_mdc(processed)
+        # Convert the Arguments, Returns, Examples, Notes, Warnings and Raises
+        # sections in a single left-to-right scan. Every section header ends in
+        # "**:", so docstrings without that literal cannot match and skip the scan.
+        if "**:" in docstring:
+            processed = _SECTIONS_RE.sub(self._replace_section, processed)
 
-        # 7. Convert remaining code blocks to MDC code groups (do this last)
-        processed = self._convert_code_blocks_to_mdc(processed)
+        # Convert remaining code blocks to MDC code groups (do this last).
+        # A group needs at least two fenced blocks, i.e. four fences.
+        if processed.count("```") >= 4:
+            processed = self._convert_code_blocks_to_mdc(processed)
 
         return processed
 
@@ -182,13 +272,8 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring with consecutive code blocks replaced by a
             single MDC code group component when applicable.
         """
-        import re
-
-        # Pattern to match multiple consecutive code blocks
-        code_block_pattern = r"```(\w+)?\n(.*?)\n```"
-
         # Find all code blocks
-        matches = list(re.finditer(code_block_pattern, docstring, re.DOTALL))
+        matches = list(_CODE_BLOCK_RE.finditer(docstring))
 
         if len(matches) <= 1:
             return docstring  # Single or no code blocks, keep as is
@@ -200,49 +285,39 @@ class MDCMarkdownRenderer(MarkdownRenderer):
 
         for match in matches:
             # Check if this block is close to the previous one (within 2 lines)
-            lines_between = docstring[last_end : match.start()].count("\n")
+            lines_between = docstring.count("\n", last_end, match.start())
 
             if current_group and lines_between > 2:
                 # Start a new group
                 groups.append(current_group)
                 current_group = []
 
-            language = match.group(1) or "text"
-            code = match.group(2).strip()
-            current_group.append({"language": language, "filename": language, "code": code, "match": match})
+            current_group.append(match)
             last_end = match.end()
 
         if current_group:
             groups.append(current_group)
 
-        # Replace groups with MDC components (only if group has multiple blocks)
-        result = docstring
-        offset = 0
+        # Replace groups with MDC components (only if group has multiple blocks),
+        # stitching untouched text and replacements together in a single pass
+        parts = []
+        cursor = 0
 
         for group in groups:
             if len(group) > 1:  # Only convert groups with multiple blocks
                 # Create MDC code group
                 component = self.mdc_components.get("code_block", "UCodeGroup")
-                code_blocks = []
-
-                for block in group:
-                    code_blocks.append(
-                        {"language": block["language"], "filename": block["language"], "code": block["code"]}
-                    )
-
-                mdc_code_group = create_mdc_code_group(code_blocks, component)
 
                 # Replace the entire group
-                first_match = group[0]["match"]
-                last_match = group[-1]["match"]
-
-                start_pos = first_match.start() + offset
-                end_pos = last_match.end() + offset
+                parts.append(docstring[cursor : group[0].start()])
+                parts.append(_create_mdc_code_group(map(_code_block_from_match, group), component))
+                cursor = group[-1].end()
 
-                result = result[:start_pos] + mdc_code_group + result[end_pos:]
-                offset += len(mdc_code_group) - (end_pos - start_pos)
+        if not parts:
+            return docstring
 
-        return result
+        parts.append(docstring[cursor:])
+        return "".join(parts)
 
     def _convert_section_to_mdc(self, docstring: str, section_name: str, component_key: str) -> str:
         """Convert a docstring section with list items to an MDC component.
@@ -256,47 +331,57 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring with the specified section replaced by an MDC
             component if it contains items.
         """
-        import re
-
-        # Pattern to match sections like **Arguments**: with list items
-        # Handle optional whitespace and indentation
-        pattern = rf"\*\*{section_name}\*\*:\s*\n\s*\n((?:\s*- `[^`]+` - .+\n?)+)"
-
-        def replace_section(match):
-            items_text = match.group(1)
-            if not items_text.strip():
-                return match.group(0)
+        # Sections like **Arguments**: with list items, allowing optional whitespace and indentation
+        return _section_pattern(section_name).sub(
+            lambda match: self._render_list_section(
+                match.group(0), match.group("items_body"), section_name, component_key
+            ),
+            docstring,
+        )
 
-            # Parse the items
-            items = []
-            item_pattern = r"\s*- `([^`]+)` - (.+)"
-            for item_match in re.finditer(item_pattern, items_text):
-                item_name = item_match.group(1)
-                item_description = item_match.group(2).strip()
+    def _render_list_section(self, section: str, items_text: str, section_name: str, component_key: str) -> str:
+        """Render the list items of a section as an MDC component.
 
-                # Try to extract type information from the item_name if it contains type hints
-                if ":" in item_name:
-                    name_parts = item_name.split(":", 1)
-                    name = name_parts[0].strip()
-                    type_info = name_parts[1].strip()
-                else:
-                    name = item_name
-                    type_info = ""
+        Args:
+            section (str): The full matched section, returned unchanged when no
+                items can be parsed.
+            items_text (str): The list items following the section header.
+            section_name (str): Name of the section (e.g. ``"Arguments"``).
+            component_key (str): Key used to look up the MDC component name.
 
-                items.append({"name": name, "type": type_info, "content": item_description})
+        Returns:
+            str: The MDC component for the section.
+        """
+        if not items_text.strip():
+            return section
+
+        # Parse the items
+        items = []
+        for item_match in _ITEM_RE.finditer(items_text):
+            item_name = item_match.group(1)
+            item_description = item_match.group(2).strip()
+
+            # Try to extract type information from the item_name if it contains type hints
+            if ":" in item_name:
+                name_parts = item_name.split(":", 1)
+                name = name_parts[0].strip()
+                type_info = name_parts[1].strip()
+            else:
+                name = item_name
+                type_info = ""
 
-            if not items:
-                return match.group(0)
+            items.append({"name": name, "type": type_info, "content": item_description})
 
-            # Generate appropriate MDC component
-            component = self.mdc_components.get(component_key, f"U{section_name}")
+        if not items:
+            return section
 
-            if component_key == "arguments":
-                return create_mdc_arguments(items, component)
-            else:
-                return create_mdc_variables(items, component)  # Use variables format for other sections
+        # Generate appropriate MDC component
+        component = self.mdc_components.get(component_key, f"U{section_name}")
 
-        return re.sub(pattern, replace_section, docstring, flags=re.MULTILINE)
+        if component_key == "arguments":
+            return create_mdc_arguments(items, component)
+        else:
+            return create_mdc_variables(items, component)  # Use variables format for other sections
 
     def _convert_returns_to_mdc(self, docstring: str) -> str:
         """Convert ``Returns`` sections to MDC components.
@@ -308,19 +393,12 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring with ``Returns`` sections wrapped in the
             configured MDC component.
         """
-        import re
-
-        # Pattern to match **Returns**: sections
-        pattern = r"\*\*Returns\*\*:\s*\n\n([^*]+)(?=\n\n\*\*|\Z)"
-
-        def replace_returns(match):
-            content = match.group(1).strip()
-            component = self.mdc_components.get("returns", "UReturns")
-            component_name = _convert_to_kebab_case(component)
+        return _RETURNS_RE.sub(lambda match: self._render_returns(match.group(1)), docstring)
 
-            return f"::{component_name}\n{content}\n::"
-
-        return re.sub(pattern, replace_returns, docstring, flags=re.DOTALL)
+    def _render_returns(self, content: str) -> str:
+        """Wrap the body of a ``Returns`` section in the configured component."""
+        component_name = self._component_name("returns", "UReturns")
+        return f"::{component_name}\n{content.strip()}\n::"
 
     def _convert_examples_to_mdc(self, docstring: str) -> str:
         """Convert ``Examples`` sections to MDC code groups.
@@ -332,32 +410,21 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring with ``Examples`` sections converted to MDC code
             group components when code blocks are detected.
         """
-        import re
-
-        # Pattern to match **Examples**: sections that contain code
-        pattern = r"\*\*Examples\*\*:\s*\n\n(.*?)(?=\n\n\*\*|\Z)"
+        return _EXAMPLES_RE.sub(lambda match: self._render_examples(match.group(1)), docstring)
 
-        def replace_examples(match):
-            content = match.group(1).strip()
-            component = self.mdc_components.get("examples", "UCodeGroup")
+    def _render_examples(self, content: str) -> str:
+        """Turn the code blocks of an ``Examples`` section into a code group."""
+        content = content.strip()
+        component = self.mdc_components.get("examples", "UCodeGroup")
 
-            # If content contains code blocks, extract them
-            code_pattern = r"```(\w+)?\n(.*?)\n```"
-            code_matches = list(re.finditer(code_pattern, content, re.DOTALL))
+        # If content contains code blocks, extract them
+        code_matches = list(_CODE_BLOCK_RE.finditer(content)) if "```" in content else []
 
-            if code_matches:
-                code_blocks = []
-                for code_match in code_matches:
-                    language = code_match.group(1) or "text"
-                    code = code_match.group(2).strip()
-                    code_blocks.append({"language": language, "filename": language, "code": code})
-
-                return create_mdc_code_group(code_blocks, component)
-            else:
-                # No code blocks, return as simple content
-                return f"**Examples**:\n\n{content}"
-
-        return re.sub(pattern, replace_examples, docstring, flags=re.DOTALL)
+        if code_matches:
+            return _create_mdc_code_group(map(_code_block_from_match, code_matches), component)
+        else:
+            # No code blocks, return as simple content
+            return f"**Examples**:\n\n{content}"
 
     def _convert_notes_to_mdc(self, docstring: str) -> str:
         """Convert ``Notes`` sections to alert components.
@@ -369,16 +436,12 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring where ``Notes`` sections are replaced by MDC
             alert components.
         """
-        import re
-
-        pattern = r"\*\*Notes?\*\*:\s*\n\n(.*?)(?=\n\n\*\*|\Z)"
+        return _NOTES_RE.sub(lambda match: self._render_notes(match.group(1)), docstring)
 
-        def replace_notes(match):
-            content = match.group(1).strip()
-            component = self.mdc_components.get("notes", "UAlert")
-            return create_mdc_alert(content, "info", "Note", component)
-
-        return re.sub(pattern, replace_notes, docstring, flags=re.DOTALL)
+    def _render_notes(self, content: str) -> str:
+        """Render the body of a ``Notes`` section as an info alert."""
+        component = self.mdc_components.get("notes", "UAlert")
+        return create_mdc_alert(content.strip(), "info", "Note", component)
 
     def _convert_warnings_to_mdc(self, docstring: str) -> str:
         """Convert ``Warnings`` sections to alert components.
@@ -390,16 +453,12 @@ class MDCMarkdownRenderer(MarkdownRenderer):
             str: The docstring where ``Warnings`` sections are replaced by MDC
             alert components.
         """
-        import re
-
-        pattern = r"\*\*Warnings?\*\*:\s*\n\n(.*?)(?=\n\n\*\*|\Z)"
+        return _WARNINGS_RE.sub(lambda match: self._render_warnings(match.group(1)), docstring)
 
-        def replace_warnings(match):
-            content = match.group(1).strip()
-            component = self.mdc_components.get("warnings", "UAlert")
-            return create_mdc_alert(content, "warning", "Warning", component)
-
-        return re.sub(pattern, replace_warnings, docstring, flags=re.DOTALL)
+    def _render_warnings(self, content: str) -> str:
+        """Render the body of a ``Warnings`` section as a warning alert."""
+        component = self.mdc_components.get("warnings", "UAlert")
+        return create_mdc_alert(content.strip(), "warning", "Warning", component)
 
     def _convert_raises_to_mdc(self, docstring: str) -> str:
         """Convert ``Raises`` sections to callout components.
@@ -410,33 +469,53 @@ class MDCMarkdownRenderer(MarkdownRenderer):
         Returns:
             str: The docstring where ``Raises`` sections are replaced with MDC callout components summarizing the exceptions raised.
         """
-        import re
-
-        pattern = r"\*\*Raises\*\*:\s*\n\n(.*?)(?=\n\n\*\*|\Z)"
+        return _RAISES_RE.sub(lambda match: self._render_raises(match.group(0), match.group(1)), docstring)
 
-        def replace_raises(match):
-            items_text = match.group(1).strip()
-            if not items_text:
-                return match.group(0)
+    def _render_raises(self, section: str, items_text: str) -> str:
+        """Render the exceptions listed in a ``Raises`` section as a callout.
 
-            component = self.mdc_components.get("raises", "UCallout")
-            component_name = _convert_to_kebab_case(component)
-
-            # Parse exception items
-            exceptions = []
-            item_pattern = r"- `([^`]+)`: (.+)"
-            for item_match in re.finditer(item_pattern, items_text):
-                exception_type = item_match.group(1)
-                description = item_match.group(2).strip()
-                exceptions.append(f"**{exception_type}**: {description}")
-
-            if exceptions:
-                content = "\n".join(exceptions)
-                return f"::{component_name}\n---\ntype: error\n---\n{content}\n::"
-
-            return match.group(0)
+        Args:
+            section (str): The full matched section, returned unchanged when no
+                exceptions can be parsed.
+            items_text (str): The body of the section.
 
-        return re.sub(pattern, replace_raises, docstring, flags=re.DOTALL)
+        Returns:
+            str: The MDC callout component for the section.
+        """
+        items_text = items_text.strip()
+        if not items_text:
+            return section
+
+        component_name = self._component_name("raises", "UCallout")
+
+        # Parse exception items
+        exceptions = []
+        for item_match in _RAISES_ITEM_RE.finditer(items_text):
+            exception_type = item_match.group(1)
+            description = item_match.group(2).strip()
+            exceptions.append(f"**{exception_type}**: {description}")
+
+        if exceptions:
+            content = "\n".join(exceptions)
+            return f"::{component_name}\n---\ntype: error\n---\n{content}\n::"
+
+        return section
+
+    def _replace_section(self, match: t.Match[str]) -> str:
+        """Dispatch a #_SECTIONS_RE match to the renderer for its section."""
+        kind = match.lastgroup
+        body = match.group(f"{kind}_body")
+        if kind == "arguments":
+            return self._render_list_section(match.group(0), body, "Arguments", "arguments")
+        if kind == "returns":
+            return self._render_returns(body)
+        if kind == "examples":
+            return self._render_examples(body)
+        if kind == "notes":
+            return self._render_notes(body)
+        if kind == "warnings":
+            return self._render_warnings(body)
+        return self._render_raises(match.group(0), body)
 
     def _convert_arguments_to_mdc(self, docstring: str) -> str:
         """Convert ``Arguments`` sections to MDC components.
@@ -469,6 +548,14 @@ class NuxtContentResolver(MarkdownReferenceResolver):
                 (e.g., ``'/docs/api'``)
         """
         self.base_path = base_path.strip("/")
+        # Root-relative, lowercased URL prefix for resolved references (e.g. ``'/docs/api/'``).
+        # The leading slash is important for root-relative paths that Nuxt Content understands.
+        self._base_prefix = posixpath.join("/", self.base_path, "").lower()
+        # Member lookup tables keyed by ``id()`` of the scope object. The object is stored next
+        # to its table so that its id cannot be reused by another object while it is cached.
+        self._member_index: t.Dict[int, t.Tuple[docspec.ApiObject, t.Dict[str, docspec.ApiObject]]] = {}
+        # Resolved URLs keyed by reference; the same names are referenced from many docstrings.
+        self._ref_urls: t.Dict[str, str] = {}
 
     def generate_object_id(self, obj: docspec.ApiObject) -> str:
         """Generates a unique ID for an API object, used for anchor links."""
@@ -480,12 +567,24 @@ class NuxtContentResolver(MarkdownReferenceResolver):
         """Finds an object from a reference string starting from the current scope and moving up."""
         obj: t.Optional[docspec.ApiObject] = scope
         while obj:
-            resolved = docspec.get_member(obj, ref_split[0])
+            resolved = self._get_member(obj, ref_split[0])
             if resolved:
                 return resolved
             obj = obj.parent
         return None
 
+    def _get_member(self, obj: docspec.ApiObject, name: str) -> t.Optional[docspec.ApiObject]:
+        """Like #docspec.get_member(), but backed by a name index built once per object."""
+        entry = self._member_index.get(id(obj))
+        if entry is None:
+            members: t.Dict[str, docspec.ApiObject] = {}
+            if isinstance(obj, docspec.HasMembers):
+                for member in obj.members:
+                    # The first member with a given name wins, as in docspec.get_member()
+                    members.setdefault(member.name, member)
+            entry = self._member_index[id(obj)] = (obj, members)
+        return entry[1].get(name)
+
     def resolve_ref(self, scope: docspec.ApiObject, ref: str) -> t.Optional[str]:
         """
         Resolve a reference to a Markdown file path for Nuxt Content.
@@ -504,13 +603,13 @@ class NuxtContentResolver(MarkdownReferenceResolver):
         # A more robust implementation would use `_resolve_local_reference` and search the API suite.
         # This simple implementation matches the previous behavior but within the new structure.
 
-        # Convert dotted name to URL path
-        ref_path: str = ref.replace(".", "/")
-
-        # Join parts to form the final link that Nuxt Content can understand
-        # The leading slash is important for root-relative paths.
-        url: str = posixpath.join("/", self.base_path, ref_path)
-        return url.lower()
+        # Convert dotted name to URL path and append it to the root-relative base prefix. Leading
+        # separators (from refs like ``.module``) are dropped so the URL stays below the base and
+        # can never become protocol-relative (``//module``).
+        url = self._ref_urls.get(ref)
+        if url is None:
+            url = self._ref_urls[ref] = self._base_prefix + ref.replace(".", "/").lstrip("/").lower()
+        return url
 
 
 @dataclasses.dataclass
@@ -611,6 +710,10 @@ class NuxtRenderer(Renderer):
 
     def __post_init__(self) -> None:
         self._context: Context
+        #: Output directories already created during the current render pass.
+        self._created_dirs: t.Set[str] = set()
+        #: Modules by name, with the module list the index was built from.
+        self._module_index: t.Optional[t.Tuple[t.List[docspec.Module], t.Dict[str, docspec.Module]]] = None
         # Configure MDC renderer with our settings
         self.markdown.use_mdc = self.use_mdc
         self.markdown.mdc_components = self.mdc_components
@@ -633,7 +736,10 @@ class NuxtRenderer(Renderer):
             filename (str): Destination file path.
         """
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        directory = os.path.dirname(filename)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
         frontmatter = self._build_frontmatter(modules, page)
 
         source_content = self._read_source_content(page)
@@ -703,10 +809,12 @@ class NuxtRenderer(Renderer):
             t.Optional[docspec.Module]: The matching module or ``None`` if not
             found.
         """
-        for module in modules:
-            if module.name == name:
-                return module
-        return None
+        if self._module_index is None or self._module_index[0] is not modules:
+            index: t.Dict[str, docspec.Module] = {}
+            for module in modules:
+                index.setdefault(module.name, module)
+            self._module_index = (modules, index)
+        return self._module_index[1].get(name)
 
     def _render_module_members(self, buffer: t.TextIO, module: docspec.Module) -> None:
         """Render all members of a module.
@@ -743,7 +851,7 @@ class NuxtRenderer(Renderer):
         """
         with open(filename, "w", encoding="utf8") as fp:
             fp.write("---\n")
-            fp.write(str(yaml.safe_dump(frontmatter, default_flow_style=False, allow_unicode=True)))
+            yaml.safe_dump(frontmatter, fp, default_flow_style=False, allow_unicode=True)
             fp.write("---\n\n")
             fp.write(content)
 
@@ -765,10 +873,15 @@ class NuxtRenderer(Renderer):
             frontmatter["title"] = page.title
 
         if self._needs_description(frontmatter, primary_object):
-            docstring = ""
-            if primary_object and getattr(primary_object, "docstring", None) and primary_object.docstring is not None:
-                docstring = primary_object.docstring.content.strip()
-            frontmatter["description"] = docstring.split("\n", 1)[0] if docstring else ""
+            summary = ""
+            if primary_object is not None and getattr(primary_object, "docstring", None) is not None:
+                # Only the first line is needed, so stop at the first line break instead of
+                # splitting the whole docstring. A trailing-whitespace-only remainder means the
+                # summary is the last line, whose end the original full strip() also trimmed.
+                summary, _, rest = primary_object.docstring.content.lstrip().partition("\n")
+                if not rest or rest.isspace():
+                    summary = summary.rstrip()
+            frontmatter["description"] = summary
 
         # Only build navigation object if it's a dict or if we need to add defaults to objects
         navigation_value = frontmatter.get("navigation")
@@ -800,11 +913,10 @@ class NuxtRenderer(Renderer):
             bool: ``True`` if a description should be derived from
             ``primary_object``.
         """
-        return bool(
+        return (
             "description" not in frontmatter
-            and primary_object
-            and getattr(primary_object, "docstring", None)
-            and primary_object.docstring is not None
+            and primary_object is not None
+            and getattr(primary_object, "docstring", None) is not None
         )
 
     def _build_navigation(
@@ -822,21 +934,17 @@ class NuxtRenderer(Renderer):
             t.Dict[str, t.Any]: A navigation dictionary suitable for Nuxt
             Content.
         """
-        navigation_value = frontmatter.get("navigation", {})
-        if isinstance(navigation_value, bool):
-            # If navigation is True, create a default navigation dict
-            # If navigation is False, we still create a dict but might handle it differently
-            navigation = {}
-        elif isinstance(navigation_value, dict):
-            navigation = navigation_value.copy()
-        else:
-            navigation = {}
+        navigation_value = frontmatter.get("navigation")
+        # Copy configured navigation dicts, which may be shared through ``default_frontmatter``;
+        # booleans and other values start from an empty navigation dict.
+        navigation = navigation_value.copy() if isinstance(navigation_value, dict) else {}
 
         if "title" not in navigation:
             navigation["title"] = frontmatter["title"]
         if "icon" not in navigation:
             icon_key = self._get_icon_key(primary_object)
-            navigation["icon"] = self.object_icons.get(icon_key, self.object_icons["page"])
+            icon = self.object_icons.get(icon_key)
+            navigation["icon"] = icon if icon is not None else self.object_icons["page"]
         return navigation
 
     def _get_icon_key(self, primary_object: t.Optional[docspec.ApiObject]) -> str:
@@ -869,6 +977,8 @@ class NuxtRenderer(Renderer):
         logger.info(f"Rendering documentation to {self.content_directory}")
 
         os.makedirs(self.content_directory, exist_ok=True)
+        self._created_dirs = {self.content_directory}
+        self._module_index = None
         known_files = KnownFiles(self.content_directory)
 
         if self.clean_render:
@@ -884,12 +994,11 @@ class NuxtRenderer(Renderer):
             known_files (KnownFiles): Tracker object containing files from the
                 last render.
         """
-        for file_ in known_files.load():
-            try:
-                os.remove(file_.name)
-                logger.debug(f"Removed {file_.name}")
-            except FileNotFoundError:
-                pass
+        # Remove files grouped by directory so consecutive unlinks hit the same directory entries
+        for filename in sorted(file_.name for file_ in known_files.load()):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(filename)
+                logger.debug(f"Removed {filename}")
 
     def _get_page_filename(self, item, page):
         """Determine the output filename for a page.
@@ -901,13 +1010,11 @@ class NuxtRenderer(Renderer):
         Returns:
             str: Full path to the output file.
         """
+        name = page.name if page.name is not None else "index"
         if hasattr(page, "directory") and page.directory:
-            directory = os.path.join(self.content_directory, page.directory)
-            name = page.name if page.name is not None else "index"
-            return os.path.join(directory, name + page.extension)
+            return os.path.join(self.content_directory, page.directory, name + page.extension)
         else:
             # For pages without directory, place them directly in content_directory
-            name = page.name if page.name is not None else "index"
             return os.path.join(self.content_directory, name + page.extension)
 
     def _render_all_pages(self, modules: t.List[docspec.Module], known_files: KnownFiles) -> None:
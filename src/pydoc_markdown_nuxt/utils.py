@@ -2,10 +2,15 @@
 Utility functions for working with Nuxt Content and MDC syntax.
 """
 
-import re
-from typing import Any, Dict, List, Optional
+import functools
+import string
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+#: Translation table that prefixes every ASCII uppercase letter with a hyphen.
+_KEBAB_CASE_TABLE = {ord(char): f"-{char}" for char in string.ascii_uppercase}
 
+
+@functools.lru_cache(maxsize=256)
 def _convert_to_kebab_case(component_name: str) -> str:
     """Convert a component name to kebab-case.
 
@@ -30,9 +35,11 @@ def _convert_to_kebab_case(component_name: str) -> str:
 
     # Convert PascalCase to kebab-case
     # Insert hyphens before uppercase letters (except the first one)
-    kebab_case = re.sub(r"(?<!^)(?=[A-Z])", "-", component_name).lower()
+    kebab_case = component_name.translate(_KEBAB_CASE_TABLE)
+    if kebab_case.startswith("-"):
+        kebab_case = kebab_case[1:]
 
-    return kebab_case
+    return kebab_case.lower()
 
 
 def create_mdc_alert(content: str, type: str = "info", title: Optional[str] = None, component: str = "alert") -> str:
@@ -71,25 +78,31 @@ def create_mdc_code_group(code_blocks: List[Dict[str, str]], component: str = "c
     Returns:
         str: MDC code group syntax string.
     """
+    return _create_mdc_code_group(
+        ((block.get("language", "text"), block.get("filename", ""), block.get("code", "")) for block in code_blocks),
+        component,
+    )
+
+
+def _create_mdc_code_group(code_blocks: Iterable[Tuple[str, str, str]], component: str = "code-group") -> str:
+    """Create an MDC code group from ``(language, filename, code)`` tuples.
+
+    This is the tuple-based core of #create_mdc_code_group() used by the renderer, which
+    avoids building a dictionary for every code block it extracts from a docstring.
+    """
     # Convert component name to kebab-case
     component_name = _convert_to_kebab_case(component)
 
-    result = f"::{component_name}\n"
-
-    for block in code_blocks:
-        lang = block.get("language", "text")
-        filename = block.get("filename", "")
-        code = block.get("code", "")
+    parts = [f"::{component_name}\n"]
 
+    for lang, filename, code in code_blocks:
         if filename:
-            result += f"```{lang} [{filename}]\n"
+            parts.append(f"```{lang} [{filename}]\n{code}\n```\n")
         else:
-            result += f"```{lang}\n"
-
-        result += f"{code}\n```\n"
+            parts.append(f"```{lang}\n{code}\n```\n")
 
-    result += "::"
-    return result
+    parts.append("::")
+    return "".join(parts)
 
 
 def create_mdc_tabs(tabs: List[Dict[str, str]], component: str = "tabs") -> str:
@@ -107,18 +120,37 @@ def create_mdc_tabs(tabs: List[Dict[str, str]], component: str = "tabs") -> str:
     # Convert component name to kebab-case
     component_name = _convert_to_kebab_case(component)
 
-    result = f"::{component_name}\n"
+    parts = [f"::{component_name}\n"]
 
     for tab in tabs:
         title = tab.get("title", "Tab")
         content = tab.get("content", "")
 
-        result += f'  ::div{{label="{title}"}}\n'
-        result += f"  {content}\n"
-        result += "  ::\n"
+        parts.append(f'  ::div{{label="{title}"}}\n  {content}\n  ::\n')
+
+    parts.append("::")
+    return "".join(parts)
+
+
+def _create_mdc_item_list(items: List[Dict[str, str]], key: str, component: str) -> str:
+    """Create an MDC component listing ``items`` under the frontmatter ``key``.
 
-    result += "::"
-    return result
+    This is the shared implementation of #create_mdc_variables() and #create_mdc_arguments().
+    """
+    # Convert component name to kebab-case
+    component_name = _convert_to_kebab_case(component)
+
+    # Build the frontmatter-style items section
+    parts = [f"::{component_name}\n---\n{key}:\n"]
+    for item in items:
+        name = item.get("name", "")
+        type_info = item.get("type", "")
+        content = item.get("content", "")
+
+        parts.append(f"  - name: {name}\n    type: {type_info}\n    content: {content}\n")
+
+    parts.append("---\n::")
+    return "".join(parts)
 
 
 def create_mdc_variables(variables: List[Dict[str, str]], component: str = "UVariables") -> str:
@@ -133,23 +165,7 @@ def create_mdc_variables(variables: List[Dict[str, str]], component: str = "UVar
     Returns:
         str: MDC variables syntax string.
     """
-    # Convert component name to kebab-case
-    component_name = _convert_to_kebab_case(component)
-
-    # Build the frontmatter-style variables section
-    variables_yaml = "---\nvariables:\n"
-    for var in variables:
-        name = var.get("name", "")
-        type_info = var.get("type", "")
-        content = var.get("content", "")
-
-        variables_yaml += f"  - name: {name}\n"
-        variables_yaml += f"    type: {type_info}\n"
-        variables_yaml += f"    content: {content}\n"
-
-    variables_yaml += "---"
-
-    return f"::{component_name}\n{variables_yaml}\n::"
+    return _create_mdc_item_list(variables, "variables", component)
 
 
 def create_mdc_arguments(arguments: List[Dict[str, str]], component: str = "UArguments") -> str:
@@ -164,23 +180,14 @@ def create_mdc_arguments(arguments: List[Dict[str, str]], component: str = "UArg
     Returns:
         str: MDC arguments syntax string.
     """
-    # Convert component name to kebab-case
-    component_name = _convert_to_kebab_case(component)
-
-    # Build the frontmatter-style arguments section
-    arguments_yaml = "---\narguments:\n"
-    for arg in arguments:
-        name = arg.get("name", "")
-        type_info = arg.get("type", "")
-        content = arg.get("content", "")
+    return _create_mdc_item_list(arguments, "arguments", component)
 
-        arguments_yaml += f"  - name: {name}\n"
-        arguments_yaml += f"    type: {type_info}\n"
-        arguments_yaml += f"    content: {content}\n"
 
-    arguments_yaml += "---"
-
-    return f"::{component_name}\n{arguments_yaml}\n::"
+#: Frontmatter key and default component for each #create_variable_or_argument_component() type.
+_ITEM_LIST_COMPONENTS: Dict[str, Tuple[str, str]] = {
+    "variables": ("variables", "UVariables"),
+    "arguments": ("arguments", "UArguments"),
+}
 
 
 def create_variable_or_argument_component(
@@ -199,15 +206,12 @@ def create_variable_or_argument_component(
     Returns:
         str: MDC component syntax string.
     """
-    if component is None:
-        component = f"U{component_type.capitalize()}"
+    try:
+        key, default_component = _ITEM_LIST_COMPONENTS[component_type.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid component_type: {component_type}. Must be 'variables' or 'arguments'") from None
 
-    if component_type.lower() == "variables":
-        return create_mdc_variables(items, component)
-    elif component_type.lower() == "arguments":
-        return create_mdc_arguments(items, component)
-    else:
-        raise ValueError(f"Invalid component_type: {component_type}. Must be 'variables' or 'arguments'")
+    return _create_mdc_item_list(items, key, default_component if component is None else component)
 
 
 def create_navigation_entry(
@@ -238,6 +242,17 @@ def create_navigation_entry(
     return entry
 
 
+#: Frontmatter defaults added by #enhance_frontmatter_for_nuxt() for page types without extras.
+_DEFAULT_PAGE_FRONTMATTER: Dict[str, Any] = {"layout": "default", "navigation": True}
+
+#: Frontmatter defaults added by #enhance_frontmatter_for_nuxt(), per page type.
+_PAGE_TYPE_FRONTMATTER: Dict[str, Dict[str, Any]] = {
+    "reference": {"layout": "docs", "navigation": True, "aside": True, "toc": True},
+    "guide": {**_DEFAULT_PAGE_FRONTMATTER, "aside": True, "prev": True, "next": True},
+    "example": {**_DEFAULT_PAGE_FRONTMATTER, "prose": True, "copy": True},
+}
+
+
 def enhance_frontmatter_for_nuxt(frontmatter: Dict[str, Any], page_type: str = "doc") -> Dict[str, Any]:
     """
     Enhance frontmatter with Nuxt Content specific fields.
@@ -250,31 +265,9 @@ def enhance_frontmatter_for_nuxt(frontmatter: Dict[str, Any], page_type: str = "
     Returns:
         Dict[str, Any]: Enhanced frontmatter dictionary.
     """
-    enhanced = frontmatter.copy()
-
-    # Add common Nuxt Content fields
-    if "layout" not in enhanced:
-        if page_type == "reference":
-            enhanced["layout"] = "docs"
-        else:
-            enhanced["layout"] = "default"
-
-    if "navigation" not in enhanced:
-        enhanced["navigation"] = True
-
-    # Add page type specific enhancements
-    if page_type == "reference":
-        enhanced.setdefault("aside", True)
-        enhanced.setdefault("toc", True)
-    elif page_type == "guide":
-        enhanced.setdefault("aside", True)
-        enhanced.setdefault("prev", True)
-        enhanced.setdefault("next", True)
-    elif page_type == "example":
-        enhanced.setdefault("prose", True)
-        enhanced.setdefault("copy", True)
-
-    return enhanced
+    # Add common Nuxt Content fields and page type specific enhancements; values already
+    # present in ``frontmatter`` take precedence over the defaults.
+    return {**_PAGE_TYPE_FRONTMATTER.get(page_type, _DEFAULT_PAGE_FRONTMATTER), **frontmatter}
 
 
 def generate_api_breadcrumbs(module_path: str, base_url: str = "/docs") -> List[Dict[str, str]]:
@@ -290,17 +283,15 @@ def generate_api_breadcrumbs(module_path: str, base_url: str = "/docs") -> List[
     """
     breadcrumbs = []
 
-    parts = module_path.split(".")
+    *parents, current = module_path.split(".")
     current_path = base_url
 
-    for i, part in enumerate(parts):
+    for part in parents:
         current_path += f"/{part}"
+        breadcrumbs.append({"title": part, "to": current_path})
 
-        if i == len(parts) - 1:
-            # Last item (current page) - no link
-            breadcrumbs.append({"title": part})
-        else:
-            breadcrumbs.append({"title": part, "to": current_path})
+    # Last item (current page) - no link
+    breadcrumbs.append({"title": current})
 
     return breadcrumbs
 
@@ -335,8 +326,7 @@ def create_api_overview_table(classes: List[Dict[str, str]]) -> str:
     if not classes:
         return ""
 
-    table: str = "| Class | Description |\n"
-    table += "|-------|-------------|\n"
+    rows: List[str] = ["| Class | Description |\n", "|-------|-------------|\n"]
 
     for cls in classes:
         name: str = cls.get("name", "")
@@ -346,9 +336,9 @@ def create_api_overview_table(classes: List[Dict[str, str]]) -> str:
         if link:
             name = f"[{name}]({link})"
 
-        table += f"| {name} | {description} |\n"
+        rows.append(f"| {name} | {description} |\n")
 
-    return table
+    return "".join(rows)
 
 
 class NuxtContentHelper:
@@ -356,6 +346,8 @@ class NuxtContentHelper:
     Helper class for generating Nuxt Content compatible documentation.
     """
 
+    __slots__ = ("base_url", "use_mdc", "mdc_components")
+
     def __init__(self, base_url: str = "/docs", use_mdc: bool = True, mdc_components: Optional[Dict[str, str]] = None):
         """Initialize the helper.
 
@@ -410,7 +402,9 @@ class NuxtContentHelper:
         """
         if self.use_mdc:
             component_name = self.get_component_name(component_type)
-            return f"::{component_name}{{{props}}}\n{content}\n::"
+            if props:
+                return f"::{component_name}{{{props}}}\n{content}\n::"
+            return f"::{component_name}\n{content}\n::"
         return content
 
     def create_hero_section(self, title: str, description: str, links: Optional[List[Dict[str, str]]] = None) -> str:
@@ -427,20 +421,21 @@ class NuxtContentHelper:
             str: The rendered hero section in Markdown or MDC format depending
             on ``use_mdc``.
         """
-        content = f"# {title}\n\n{description}\n"
+        parts = [f"# {title}\n\n{description}\n"]
 
         if links:
-            content += "\n"
-            for link in links:
-                label = link.get("label", "Link")
-                url = link.get("url", "#")
-                variant = link.get("variant", "primary")
-
-                if self.use_mdc:
-                    button_component = self.get_component_name("button")
-                    content += f'::{button_component}[{label}]{{to="{url}" variant="{variant}"}}\n'
-                else:
-                    content += f"[{label}]({url})\n"
+            parts.append("\n")
+            if self.use_mdc:
+                button_component = self.get_component_name("button")
+                parts.extend(
+                    f'::{button_component}[{link.get("label", "Link")}]'
+                    f'{{to="{link.get("url", "#")}" variant="{link.get("variant", "primary")}"}}\n'
+                    for link in links
+                )
+            else:
+                parts.extend(f'[{link.get("label", "Link")}]({link.get("url", "#")})\n' for link in links)
+
+        content = "".join(parts)
 
         if self.use_mdc:
             hero_component = self.get_component_name("hero")
@@ -461,20 +456,20 @@ class NuxtContentHelper:
         if not features:
             return ""
 
-        content = ""
+        feature_component = self.get_component_name("feature") if self.use_mdc else ""
+        parts = []
         for feature in features:
             title = feature.get("title", "")
             description = feature.get("description", "")
             icon = feature.get("icon", "")
 
             if self.use_mdc:
-                feature_component = self.get_component_name("feature")
                 icon_prop = f' icon="{icon}"' if icon else ""
-                content += f'::{feature_component}{{title="{title}"{icon_prop}}}\n{description}\n::\n\n'
+                parts.append(f'::{feature_component}{{title="{title}"{icon_prop}}}\n{description}\n::\n\n')
             else:
-                content += f"### {title}\n\n{description}\n\n"
+                parts.append(f"### {title}\n\n{description}\n\n")
 
-        return content.strip()
+        return "".join(parts).strip()
 
     def create_variables_section(self, variables: List[Dict[str, str]]) -> str:
         """Create a variables section using the configured component.
@@ -494,15 +489,13 @@ class NuxtContentHelper:
             return create_mdc_variables(variables, component)
         else:
             # Fallback to regular markdown table
-            content: str = "## Variables\n\n"
-            content += "| Name | Type | Description |\n"
-            content += "|------|------|-------------|\n"
+            rows: List[str] = ["## Variables\n\n| Name | Type | Description |\n|------|------|-------------|\n"]
             for var in variables:
                 name = var.get("name", "")
                 type_info = var.get("type", "")
                 description = var.get("content", "")
-                content += f"| {name} | {type_info} | {description} |\n"
-            return content
+                rows.append(f"| {name} | {type_info} | {description} |\n")
+            return "".join(rows)
 
     def create_arguments_section(self, arguments: List[Dict[str, str]]) -> str:
         """Create an arguments section using the configured component.
@@ -522,12 +515,10 @@ class NuxtContentHelper:
             return create_mdc_arguments(arguments, component)
         else:
             # Fallback to regular markdown table
-            content: str = "## Arguments\n\n"
-            content += "| Name | Type | Description |\n"
-            content += "|------|------|-------------|\n"
+            rows: List[str] = ["## Arguments\n\n| Name | Type | Description |\n|------|------|-------------|\n"]
             for arg in arguments:
                 name: str = arg.get("name", "")
                 type_info: str = arg.get("type", "")
                 description: str = arg.get("content", "")
-                content += f"| {name} | {type_info} | {description} |\n"
-            return content
+                rows.append(f"| {name} | {type_info} | {description} |\n")
+            return "".join(rows)
@@ -2,7 +2,7 @@
 Test comprehensive MDC processing with pytest.
 """
 
-from src.pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer
+from pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer
 
 
 def test_comprehensive_mdc():
@@ -64,3 +64,46 @@ def test_comprehensive_mdc():
     assert "param1" in result
     assert "param2" in result
     assert "param3" in result
+
+
+def test_docstring_without_sections_is_unchanged():
+    """Test that docstrings without section headers pass through untouched."""
+    renderer = MDCMarkdownRenderer(use_mdc=True)
+
+    docstring = "A plain summary line.\n\nSome more text with **bold** words."
+
+    assert renderer._process_docstring_for_mdc(docstring) == docstring
+
+
+def test_sections_after_raises_are_preserved():
+    """Test that sections following a Raises section are converted, not swallowed."""
+    renderer = MDCMarkdownRenderer(use_mdc=True)
+
+    docstring = (
+        "Summary.\n\n"
+        "**Raises**:\n\n- `ValueError`: When the value is invalid\n\n"
+        "**Examples**:\n\n```python\nfunction(1)\n```\n\n"
+        "**Notes**:\n\nThis is a note."
+    )
+
+    result = renderer._process_docstring_for_mdc(docstring)
+
+    assert "::u-callout" in result
+    assert "**ValueError**: When the value is invalid" in result
+    assert "function(1)" in result
+    assert '::u-alert{type="info" title="Note"}\nThis is a note.\n::' in result
+
+
+def test_converted_docstrings_follow_component_changes():
+    """Test that cached conversions are dropped when the component mapping changes."""
+    renderer = MDCMarkdownRenderer(use_mdc=True)
+
+    docstring = "Summary.\n\n**Notes**:\n\nThis is a note."
+
+    assert "::u-alert" in renderer._process_docstring_for_mdc(docstring)
+
+    renderer.mdc_components["notes"] = "MyNote"
+
+    result = renderer._process_docstring_for_mdc(docstring)
+    assert "::my-note" in result
+    assert "::u-alert" not in result
@@ -59,3 +59,23 @@ def test_renderer_discovery():
     # For now, just verify that the module and class exist and are importable
     from pydoc_markdown_nuxt import NuxtRenderer
     assert NuxtRenderer.__name__ == 'NuxtRenderer'
+
+@pytest.mark.integration
+def test_entry_point_declared_in_pyproject():
+    """Test that pyproject.toml registers the renderer under pydoc-markdown's entry point group."""
+    tomllib = pytest.importorskip('tomllib')
+    from pathlib import Path
+
+    pyproject = Path(__file__).resolve().parent.parent / 'pyproject.toml'
+    data = tomllib.loads(pyproject.read_text())
+
+    entry_points = data['project']['entry-points']['pydoc_markdown.interfaces.Renderer']
+    assert entry_points['nuxt'] == 'pydoc_markdown_nuxt:NuxtRenderer'
+
+@pytest.mark.integration
+def test_submodules_accessible_as_package_attributes():
+    """Test that the submodules stay reachable after importing only the package."""
+    import pydoc_markdown_nuxt
+
+    assert pydoc_markdown_nuxt.renderer.NuxtRenderer is pydoc_markdown_nuxt.NuxtRenderer
+    assert pydoc_markdown_nuxt.utils.create_mdc_alert is pydoc_markdown_nuxt.create_mdc_alert
@@ -2,7 +2,7 @@
 Test MDC arguments conversion with pytest.
 """
 
-from src.pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer
+from pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer
 
 
 def test_mdc_conversion(sample_arguments_docstring):
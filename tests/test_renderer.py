@@ -50,6 +50,18 @@ def test_basic_page_rendering(temp_test_dir):
     assert 'description: API reference documentation' in content
     assert 'category: API' in content
 
+@pytest.mark.unit
+def test_frontmatter_keeps_non_bmp_characters_readable(temp_test_dir):
+    """Test that characters such as emoji are written to the frontmatter unescaped."""
+    renderer = NuxtRenderer(content_directory=str(temp_test_dir))
+    renderer.pages.append(NuxtPage(title='🚀 Getting started', name='intro'))
+    renderer.init(Context(str(temp_test_dir)))
+    renderer.render([])
+
+    content = (temp_test_dir / "intro.md").read_text(encoding="utf8")
+    assert 'title: 🚀 Getting started' in content
+
+
 @pytest.mark.unit
 def test_frontmatter_merging(temp_test_dir):
     """Test that default and page-specific frontmatter are merged correctly."""
@@ -121,3 +133,32 @@ def test_directory_structure(temp_test_dir):
     assert (temp_test_dir / "index.md").exists()
     assert (temp_test_dir / "reference" / "api.md").exists()
     assert (temp_test_dir / "guides" / "tutorials" / "examples.md").exists()
+
+
+@pytest.mark.unit
+def test_get_resolver_follows_content_directory():
+    """Test that the resolver base path tracks the current content directory."""
+    renderer = NuxtRenderer(content_directory="content/docs/api")
+    assert renderer.get_resolver([]).base_path == "docs/api"
+
+    renderer.content_directory = "content/reference"
+    assert renderer.get_resolver([]).base_path == "reference"
+
+
+@pytest.mark.unit
+def test_page_source_is_reread_when_modified(temp_test_dir):
+    """Test that page sources are reread even when a rewrite keeps the modification time."""
+    source = temp_test_dir / "intro.md"
+    source.write_text("First version")
+
+    renderer = NuxtRenderer(content_directory=str(temp_test_dir / "content"))
+    renderer.init(Context(str(temp_test_dir)))
+    page = NuxtPage(title="Intro", name="intro", source="intro.md")
+
+    assert renderer._read_source_content(page) == "First version"
+
+    mtime_ns = source.stat().st_mtime_ns
+    source.write_text("Second version")
+    os.utime(source, ns=(mtime_ns, mtime_ns))
+
+    assert renderer._read_source_content(page) == "Second version"
@@ -5,7 +5,7 @@ Test NuxtContentResolver functionality with pytest.
 import docspec
 import pytest
 
-from src.pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer, NuxtContentResolver
+from pydoc_markdown_nuxt.renderer import MDCMarkdownRenderer, NuxtContentResolver
 
 
 @pytest.mark.unit
@@ -103,3 +103,45 @@ def test_mdc_markdown_renderer_with_resolver():
     assert "type: str" in result
     assert "name: config" in result
     assert "type: Config" in result
+
+
+@pytest.mark.unit
+def test_nuxt_content_resolver_local_reference():
+    """Test that local references are looked up from the scope towards the root."""
+    location = docspec.Location(filename="mypackage/core.py", lineno=1)
+    method = docspec.Function(
+        name="process", location=location, docstring=None, modifiers=None, args=[], return_type=None, decorations=[]
+    )
+    helper = docspec.Function(
+        name="helper", location=location, docstring=None, modifiers=None, args=[], return_type=None, decorations=[]
+    )
+    test_class = docspec.Class(
+        name="DataProcessor",
+        location=location,
+        docstring=None,
+        members=[method],
+        metaclass=None,
+        bases=[],
+        decorations=[],
+    )
+    module = docspec.Module(name="core", location=location, docstring=None, members=[test_class, helper])
+    module.sync_hierarchy()
+
+    resolver = NuxtContentResolver("docs/api")
+
+    assert resolver._resolve_local_reference(method, ["process"]) is method
+    assert resolver._resolve_local_reference(method, ["helper"]) is helper
+    assert resolver._resolve_local_reference(method, ["DataProcessor"]) is test_class
+    assert resolver._resolve_local_reference(method, ["missing"]) is None
+
+
+@pytest.mark.unit
+def test_resolve_ref_with_leading_dots_stays_under_base_path():
+    """Test that dotted-prefix references resolve below the base path instead of escaping it."""
+    module = docspec.Module(
+        name="mypackage", location=docspec.Location(filename="mypackage/__init__.py", lineno=1), docstring=None, members=[]
+    )
+
+    assert NuxtContentResolver("docs").resolve_ref(module, ".core.Thing") == "/docs/core/thing"
+    assert NuxtContentResolver("docs").resolve_ref(module, "..core") == "/docs/core"
+    assert NuxtContentResolver("").resolve_ref(module, ".core") == "/core"
@@ -5,6 +5,7 @@ Test utility functions with pytest.
 import pytest
 
 from pydoc_markdown_nuxt.utils import (
+    NuxtContentHelper,
     create_mdc_alert,
     create_mdc_code_group,
     create_mdc_tabs,
@@ -133,3 +134,16 @@ def test_api_breadcrumbs():
 
     assert len(breadcrumbs) == 2
     assert breadcrumbs[0]["to"].startswith("/custom/path")
+
+
+@pytest.mark.unit
+def test_wrap_with_mdc_if_enabled():
+    """Test wrapping content with a configured MDC component."""
+    helper = NuxtContentHelper()
+
+    assert helper.wrap_with_mdc_if_enabled("Body", "card", 'title="Card"') == '::u-card{title="Card"}\nBody\n::'
+    # Without props the component is emitted without an empty props block
+    assert helper.wrap_with_mdc_if_enabled("Body", "card") == "::u-card\nBody\n::"
+
+    helper.use_mdc = False
+    assert helper.wrap_with_mdc_if_enabled("Body", "card") == "Body"